@@ -4,24 +4,132 @@
 
 import os
 import sys
-import subprocess
 import datetime
+from collections import deque
 from functools import partial
+from dataclasses import dataclass
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QVBoxLayout, QFileDialog, QLabel,
-    QListWidget, QListWidgetItem, QHBoxLayout, QComboBox, QMessageBox, QFrame,
-    QScrollArea, QGridLayout
+    QListView, QHBoxLayout, QComboBox, QMessageBox, QScrollArea,
+    QAbstractItemView, QStyledItemDelegate, QStyle
+)
+from PyQt5.QtGui import (
+    QFont, QFontMetrics, QIntValidator, QDesktopServices, QPainter, QColor,
+    QStandardItemModel, QStandardItem
+)
+from PyQt5.QtCore import (
+    Qt, QUrl, QRect, QSize, QEvent, QAbstractListModel, QModelIndex, QProcess, QObject, QThread,
+    QMetaObject, pyqtSignal, pyqtSlot
 )
-from PyQt5.QtGui import QFont, QIntValidator, QDesktopServices
-from PyQt5.QtCore import Qt, QUrl
 
 # Constants
 OUTPUT_FOLDER = "./output"
+MAX_PARALLEL_EXTRACTIONS = 8  # "-c copy" is I/O-bound, so this is not tied to the CPU count
 
 # Ensure output folder exists
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# Time wheel items
+HOURS = tuple(f"{i:02d}" for i in range(24))
+SIXTY = tuple(f"{i:02d}" for i in range(60))
+
+def build_item_model(texts):
+    """Single-column item model holding texts, for sharing between combo boxes."""
+    model = QStandardItemModel()
+    for text in texts:
+        model.appendRow(QStandardItem(text))
+    return model
+
+# One model per item list, set on every time wheel (each combo only keeps its current index)
+HOUR_MODEL = build_item_model(HOURS)
+MIN_SEC_MODEL = build_item_model(SIXTY)
+
+def bold_font(pixel_size):
+    """Bold application font at a pixel size (the family resolves once the app exists)."""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(True)
+    return font
+
+# Shared fonts, so rows and painters never rebuild them
+FONT_HEADER = QFont("Arial", 20, QFont.Bold)
+FONT_LABEL = QFont("Arial", 14, QFont.Bold)  # video title
+FONT_TIME = QFont("Arial", 18, QFont.Bold)  # IN: / OUT:
+FONT_COLON = QFont("Arial", 12)
+FONT_DIGIT = bold_font(32)  # time wheel values, as in APP_QSS
+FONT_BUTTON = bold_font(16)
+FONT_QUICK_INSERT = bold_font(24)
+
+# VideoRow time fields, in IN HH:MM:SS, OUT HH:MM:SS order
+TIME_KEYS = ("in_hour", "in_min", "in_sec", "out_hour", "out_min", "out_sec")
+
+# Application-wide stylesheet, applied once in __main__.
+# Widgets opt in via objectName (#name) or the dynamic "role" property.
+APP_QSS = """
+    QWidget {
+        background-color: #121212; color: white;
+    }
+    QLabel#header {
+        color: #E0E0E0;
+    }
+
+    QScrollArea#quickInsertArea {
+        border: none;
+    }
+
+    QListView#videoList {
+        background-color: #1e1e1e; color: white; border: 1px solid #333;
+    }
+    QWidget#timeEditor {
+        background: transparent;
+    }
+
+    QComboBox#hourCombo {
+        border: 1px solid #00FFFF;
+        background-color: #222; color: #00FFFF;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#hourCombo QAbstractItemView {
+        background-color: #222; color: #00FFFF;
+        selection-background-color: #333;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#minCombo {
+        border: 1px solid #39FF14;
+        background-color: #222; color: #39FF14;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#minCombo QAbstractItemView {
+        background-color: #222; color: #39FF14;
+        selection-background-color: #333;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#secCombo {
+        border: 1px solid red;
+        background-color: #222; color: red;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#secCombo QAbstractItemView {
+        background-color: #222; color: red;
+        selection-background-color: #333;
+        font-size: 32px; font-weight: bold;
+    }
+    QComboBox#hourCombo:focus, QComboBox#minCombo:focus, QComboBox#secCombo:focus {
+        border: 2px solid #FFA500;
+    }
+
+    QPushButton#addBtn, QPushButton#extractAllBtn {
+        padding: 10px; border-radius: 5px; font-size: 16px;
+    }
+    QPushButton#addBtn {
+        background-color: #1f1f1f; color: white;
+    }
+    QPushButton#extractAllBtn {
+        background-color: #4caf50; color: white; font-weight: bold;
+    }
+"""
+
 class FocusComboBox(QComboBox):
     """
     A custom QComboBox that:
@@ -30,7 +138,11 @@ class FocusComboBox(QComboBox):
       - Notifies the main window when focused (so quick-insert buttons know which box to update)
       - Shows a thin stroke (1px) matching its text color by default
       - Shows a thicker (2px) orange stroke on focus
+    The strokes and colors come from APP_QSS, selected by objectName.
     """
+    # base_color => objectName of its APP_QSS rule set
+    OBJECT_NAMES = {"#00FFFF": "hourCombo", "#39FF14": "minCombo", "red": "secCombo"}
+
     def __init__(self, parent, main_window, min_val=0, max_val=59, base_color="#00FFFF"):
         super().__init__(parent)
         self.main_window = main_window
@@ -40,35 +152,446 @@ class FocusComboBox(QComboBox):
 
         # Allow manual editing
         self.setEditable(True)
+        # Typed values must not be added as items: the item models are shared
+        self.setInsertPolicy(QComboBox.NoInsert)
         # Limit manual input to the valid numeric range
         self.setValidator(QIntValidator(self.min_val, self.max_val, self))
 
-        # Base stylesheet:
-        #  - 1px border of base_color
-        #  - 2px orange border on focus
-        self.setStyleSheet(f"""
-            QComboBox {{
-                border: 1px solid {self.base_color};
-            }}
-            QComboBox:focus {{
-                border: 2px solid #FFA500;
-            }}
-        """)
+        # Every row has the same height, so the popup can skip per-row sizing
+        view = self.view()
+        if isinstance(view, QListView):
+            view.setUniformItemSizes(True)
+
+        # Pick the APP_QSS rule set matching base_color
+        self.setObjectName(self.OBJECT_NAMES.get(self.base_color, ""))
 
     def focusInEvent(self, e):
         self.main_window.current_combo = self  # Mark this combo as "active"
         super().focusInEvent(e)
 
+class QuickInsertGrid(QWidget):
+    """
+    Paints the 60 quick-insert cells (0-59) in 3 rows of 20 and emits
+    valueClicked with the value under the mouse. No child widgets.
+    0,1,2 => cyan text (#00FFFF); others => magenta (#FF00FF).
+    The cell under the mouse is highlighted; only that cell and the previous one are repainted.
+    """
+    valueClicked = pyqtSignal(int)
+
+    COLUMNS = 20
+    ROWS = 3
+    CELL_SIZE = 80
+    SPACING = 6
+    WIDTH = COLUMNS * (CELL_SIZE + SPACING) - SPACING
+    HEIGHT = ROWS * (CELL_SIZE + SPACING) - SPACING
+
+    CELL_COLOR = QColor("#2a2a2a")
+    HOVER_COLOR = QColor("#444444")
+    LOW_COLOR = QColor("#00FFFF")  # cyan
+    HIGH_COLOR = QColor("#FF00FF")  # magenta
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(self.WIDTH, self.HEIGHT)
+        self.setMouseTracking(True)
+        self.hover_value = None
+
+    def cell_rect(self, value):
+        step = self.CELL_SIZE + self.SPACING
+        row = value // self.COLUMNS
+        col = value % self.COLUMNS
+        return QRect(col * step, row * step, self.CELL_SIZE, self.CELL_SIZE)
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        painter.setFont(FONT_QUICK_INSERT)
+        for i in range(self.COLUMNS * self.ROWS):
+            rect = self.cell_rect(i)
+            if not rect.intersects(e.rect()):
+                continue
+            painter.fillRect(rect, self.HOVER_COLOR if i == self.hover_value else self.CELL_COLOR)
+            painter.setPen(self.LOW_COLOR if i < 3 else self.HIGH_COLOR)
+            painter.drawText(rect, Qt.AlignCenter, str(i))
+
+    def value_at(self, pos):
+        """Returns the value of the cell at pos, or None in the gaps between cells."""
+        step = self.CELL_SIZE + self.SPACING
+        col, col_offset = divmod(pos.x(), step)
+        row, row_offset = divmod(pos.y(), step)
+        if col_offset >= self.CELL_SIZE or row_offset >= self.CELL_SIZE:
+            return None
+        if 0 <= col < self.COLUMNS and 0 <= row < self.ROWS:
+            return row * self.COLUMNS + col
+        return None
+
+    def set_hover(self, value):
+        if value == self.hover_value:
+            return
+        for old_or_new in (self.hover_value, value):
+            if old_or_new is not None:
+                self.update(self.cell_rect(old_or_new))
+        self.hover_value = value
+
+    def mouseMoveEvent(self, e):
+        self.set_hover(self.value_at(e.pos()))
+        super().mouseMoveEvent(e)
+
+    def leaveEvent(self, e):
+        self.set_hover(None)
+        super().leaveEvent(e)
+
+    def mousePressEvent(self, e):
+        if e.button() != Qt.LeftButton:
+            return super().mousePressEvent(e)
+        value = self.value_at(e.pos())
+        if value is not None:
+            self.valueClicked.emit(value)
+
+@dataclass
+class VideoRow:
+    """One video in the list: its path and IN/OUT time."""
+    path: str
+    in_hour: int = 0
+    in_min: int = 0
+    in_sec: int = 0
+    out_hour: int = 0
+    out_min: int = 0
+    out_sec: int = 0
+
+class VideoModel(QAbstractListModel):
+    """
+    Holds one VideoRow per video.
+    Qt.UserRole returns the VideoRow; setData takes a dict of time fields (TIME_KEYS).
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.videos = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.videos)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        video = self.videos[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(video.path)
+        if role == Qt.UserRole:
+            return video
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        video = self.videos[index.row()]
+        for key, val in value.items():
+            setattr(video, key, val)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def append_video(self, video):
+        row = len(self.videos)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.videos.append(video)
+        self.endInsertRows()
+
+class TimeEditor(QWidget):
+    """
+    Row editor holding the six time wheels (IN HH:MM:SS, OUT HH:MM:SS).
+    The background is transparent: labels and colons are painted by the delegate,
+    the combos are placed over the boxes it paints.
+    timesChanged is emitted whenever any of the six wheels changes.
+    """
+    timesChanged = pyqtSignal()
+
+    def __init__(self, parent, main_window):
+        super().__init__(parent)
+        self.setObjectName("timeEditor")
+        self.combos = main_window.create_time_wheels() + main_window.create_time_wheels()
+        for combo in self.combos:
+            combo.setParent(self)
+            combo.currentTextChanged.connect(self.timesChanged)
+
+    @staticmethod
+    def combo_value(combo):
+        try:
+            return int(combo.currentText())
+        except ValueError:
+            # The validator allows empty text mid-edit
+            return 0
+
+    def set_times(self, video):
+        # Loading from the model must not commit half-updated wheels back to it
+        self.blockSignals(True)
+        for combo, key in zip(self.combos, TIME_KEYS):
+            # Each commit echoes the row back here; rewriting a wheel that already
+            # holds the value would reformat the text the user is typing
+            if self.combo_value(combo) != getattr(video, key):
+                combo.setCurrentText(f"{getattr(video, key):02d}")
+        self.blockSignals(False)
+
+    def times(self):
+        return {key: self.combo_value(combo) for combo, key in zip(self.combos, TIME_KEYS)}
+
+class VideoItemDelegate(QStyledItemDelegate):
+    """
+    Paints a video row: title, IN/OUT time line, Extract and Play buttons.
+    Clicking the time line opens a TimeEditor over it; the buttons are hit-tested
+    in editorEvent. Rows without an open editor own no child widgets.
+    """
+    extractClicked = pyqtSignal(int)
+    playClicked = pyqtSignal(int)
+    editClicked = pyqtSignal(int)
+
+    MARGIN = 10
+    TITLE_HEIGHT = 30
+    TIME_HEIGHT = 60
+    BUTTON_HEIGHT = 40
+    BOX_WIDTH = 180
+    GAP = 5  # between a label, colon or box and the next item
+    IN_OUT_GAP = 20
+    ROW_HEIGHT = TITLE_HEIGHT + TIME_HEIGHT + 2 * BUTTON_HEIGHT + 5 * MARGIN
+
+    BACKGROUND_COLOR = QColor("#1e1e1e")
+    BOX_COLOR = QColor("#222")
+    LABEL_COLOR = QColor("#E0E0E0")
+    TEXT_COLOR = QColor("white")
+    BUTTON_TEXT_COLOR = QColor("#000000")
+    EXTRACT_COLOR = QColor("#00FFFF")
+    PLAY_COLOR = QColor("#32CD32")
+    # Hour, minute, second colors, matching the time wheels
+    WHEEL_COLORS = (QColor("#00FFFF"), QColor("#39FF14"), QColor("red"))
+
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.focus_box = 0  # time wheel to focus when the next editor opens
+
+        # Every row has the same layout, so its size is measured once
+        _, boxes = self.time_layout(QRect(0, 0, 0, self.TIME_HEIGHT))
+        self.row_size = QSize(boxes[-1].right() + 1 + 2 * self.MARGIN, self.ROW_HEIGHT)
+
+    def row_rects(self, rect):
+        """Splits a row rect into title, time line, Extract and Play rects."""
+        m = self.MARGIN
+        left = rect.left() + m
+        width = rect.width() - 2 * m
+        title = QRect(left, rect.top() + m, width, self.TITLE_HEIGHT)
+        time_line = QRect(left, title.bottom() + 1 + m, width, self.TIME_HEIGHT)
+        extract = QRect(left, time_line.bottom() + 1 + m, width, self.BUTTON_HEIGHT)
+        play = QRect(left, extract.bottom() + 1 + m, width, self.BUTTON_HEIGHT)
+        return title, time_line, extract, play
+
+    def time_layout(self, rect):
+        """
+        Lays out the time line inside rect.
+        Returns (labels, boxes): labels is a list of (rect, text, font, color),
+        boxes the six time wheel rects in TIME_KEYS order.
+        """
+        labels, boxes = [], []
+        x = rect.left()
+
+        def add_label(text, font, color):
+            nonlocal x
+            w = QFontMetrics(font).horizontalAdvance(text)
+            labels.append((QRect(x, rect.top(), w, rect.height()), text, font, color))
+            x += w + self.GAP
+
+        for i, caption in enumerate(("IN:", "OUT:")):
+            if i:
+                x += self.IN_OUT_GAP
+            add_label(caption, FONT_TIME, self.LABEL_COLOR)
+            for j in range(3):
+                if j:
+                    add_label(":", FONT_COLON, self.TEXT_COLOR)
+                boxes.append(QRect(x, rect.top(), self.BOX_WIDTH, rect.height()))
+                x += self.BOX_WIDTH + self.GAP
+        return labels, boxes
+
+    def sizeHint(self, option, index):
+        return self.row_size
+
+    def paint(self, painter, option, index):
+        video = index.data(Qt.UserRole)
+        title, time_line, extract, play = self.row_rects(option.rect)
+
+        painter.save()
+        painter.fillRect(option.rect, self.BACKGROUND_COLOR)
+
+        painter.setFont(FONT_LABEL)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(title, Qt.AlignLeft | Qt.AlignVCenter, f"📽 {index.data(Qt.DisplayRole)}")
+
+        labels, boxes = self.time_layout(time_line)
+        for rect, text, font, color in labels:
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.setFont(FONT_DIGIT)
+        for i, (rect, key) in enumerate(zip(boxes, TIME_KEYS)):
+            color = self.WHEEL_COLORS[i % 3]
+            painter.fillRect(rect, self.BOX_COLOR)
+            painter.setPen(color)
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            painter.drawText(rect.adjusted(4, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, f"{getattr(video, key):02d}")
+
+        painter.setFont(FONT_BUTTON)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for rect, color, text in ((extract, self.EXTRACT_COLOR, "Extract"), (play, self.PLAY_COLOR, "Play")):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(self.BUTTON_TEXT_COLOR)
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            _, time_line, extract, play = self.row_rects(option.rect)
+            if extract.contains(event.pos()):
+                self.extractClicked.emit(index.row())
+                return True
+            if play.contains(event.pos()):
+                self.playClicked.emit(index.row())
+                return True
+            if time_line.contains(event.pos()):
+                _, boxes = self.time_layout(time_line)
+                self.focus_box = next((i for i, rect in enumerate(boxes) if rect.contains(event.pos())), 0)
+                self.editClicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        editor = TimeEditor(parent, self.main_window)
+        # Focus lands on the clicked wheel, making it the quick-insert target
+        editor.setFocusProxy(editor.combos[self.focus_box])
+        # Commit on every change so Extract always sees the current wheels
+        editor.timesChanged.connect(lambda: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.set_times(index.data(Qt.UserRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.times())
+
+    def updateEditorGeometry(self, editor, option, index):
+        _, time_line, _, _ = self.row_rects(option.rect)
+        editor.setGeometry(time_line)
+        _, boxes = self.time_layout(QRect(0, 0, time_line.width(), time_line.height()))
+        for combo, rect in zip(editor.combos, boxes):
+            combo.setGeometry(rect)
+
+    def destroyEditor(self, editor, index):
+        if self.main_window.current_combo in editor.combos:
+            self.main_window.current_combo = None
+        super().destroyEditor(editor, index)
+
+class ExtractWorker(QObject):
+    """
+    Runs ffmpeg extractions from its own QThread, so neither starting processes nor
+    their exits go through the GUI event loop. "-c copy" is I/O-bound, so up to
+    MAX_PARALLEL_EXTRACTIONS ffmpeg processes run at once; the rest wait in a queue.
+    jobDone(job_id, status, output_file) reports each job, status being "done" or "failed".
+    """
+    jobDone = pyqtSignal(int, str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.queue = deque()  # (job_id, input_file, start_time, end_time) not started yet
+        self.running = []  # ffmpeg QProcesses, kept referenced until they exit
+
+    @pyqtSlot(int, str, str, str)
+    def enqueue(self, job_id, input_file, start_time, end_time):
+        self.queue.append((job_id, input_file, start_time, end_time))
+        self.start_queued()
+
+    @pyqtSlot()
+    def stop(self):
+        """Drops queued jobs and kills running ffmpeg processes without reporting them."""
+        self.queue.clear()
+        for proc in self.running:
+            proc.finished.disconnect()
+            proc.errorOccurred.disconnect()
+            proc.kill()
+            proc.waitForFinished()
+        self.running.clear()
+
+    def start_queued(self):
+        while self.queue and len(self.running) < MAX_PARALLEL_EXTRACTIONS:
+            self.process_extraction(*self.queue.popleft())
+
+    def process_extraction(self, job_id, input_file, start_time, end_time):
+        """Starts ffmpeg in a QProcess living in the worker thread."""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = os.path.basename(input_file)
+        # Jobs run in parallel, so the timestamp alone can repeat: add the job id,
+        # and a counter in case a file from an earlier session has the same name
+        output_file = os.path.join(OUTPUT_FOLDER, f"{filename}_clip_{timestamp}_{job_id}.mp4")
+        counter = 1
+        while os.path.exists(output_file):
+            output_file = os.path.join(OUTPUT_FOLDER, f"{filename}_clip_{timestamp}_{job_id}_{counter}.mp4")
+            counter += 1
+
+        proc = QProcess(self)
+        proc.setProgram("ffmpeg")
+        # -n: never overwrite (stdin is the null device, so a prompt would just fail);
+        # -ss/-to before -i seek the input instead of decoding up to start_time;
+        # -copyts keeps the source timestamps (including the seek offset) instead of
+        # resetting them; -avoid_negative_ts make_zero then rebases the output to start at 0
+        proc.setArguments([
+            "-hide_banner", "-loglevel", "error", "-n",
+            "-ss", start_time, "-to", end_time, "-i", input_file,
+            "-c", "copy", "-avoid_negative_ts", "make_zero", "-copyts",
+            output_file,
+        ])
+        proc.setStandardInputFile(QProcess.nullDevice())
+        proc.setStandardErrorFile(QProcess.nullDevice())
+
+        def finish(ok):
+            self.running.remove(proc)
+            proc.deleteLater()
+            self.start_queued()
+            self.jobDone.emit(job_id, "done" if ok else "failed", output_file)
+
+        def handle_error(error):
+            # finished is never emitted when ffmpeg can't be started at all
+            if error == QProcess.FailedToStart:
+                finish(False)
+
+        proc.finished.connect(lambda code, status: finish(status == QProcess.NormalExit and code == 0))
+        proc.errorOccurred.connect(handle_error)
+        self.running.append(proc)
+        proc.start()
+
 class VideoExtractor(QWidget):
+    # (job_id, input_file, start_time, end_time), queued to the ExtractWorker thread
+    extractionRequested = pyqtSignal(int, str, str, str)
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Multi-Video In-Out Extractor")
-        self.setGeometry(100, 100, 900, 600)
-        self.setStyleSheet("background-color: #121212; color: white;")
+        self.setGeometry(100, 100, 900, 800)
 
-        self.video_list = []  # Store video file paths
+        self.video_paths_set = set()  # Added video file paths (order lives in video_model)
         self.current_combo = None  # Track which combo box is currently focused
+        self.extract_cache = {}  # (input_file, start_time, end_time) => output file of a finished clip
+        self.pending_jobs = {}  # job_id => (input_file, start_time, end_time)
+        self.pending_callbacks = {}  # (input_file, start_time, end_time) => on_done callbacks of its running job
+        self.next_job_id = 0
+
+        # ffmpeg runs from a worker thread; jobs go in via extractionRequested
+        self.extract_thread = QThread(self)
+        self.extract_worker = ExtractWorker()
+        self.extract_worker.moveToThread(self.extract_thread)
+        self.extractionRequested.connect(self.extract_worker.enqueue)
+        self.extract_worker.jobDone.connect(self.handle_job_done)
+        self.extract_thread.finished.connect(self.extract_worker.deleteLater)
+        self.extract_thread.start()
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -77,88 +600,89 @@ class VideoExtractor(QWidget):
 
         # Header Label
         header = QLabel("Multi-Video In-Out Extractor")
-        header.setFont(QFont("Arial", 20, QFont.Bold))
-        header.setStyleSheet("color: #E0E0E0;")
+        header.setObjectName("header")
+        header.setFont(FONT_HEADER)
         header.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(header)
 
-        # Quick Insert Bar (three lines of 0-59)
-        quick_insert_area = self.create_quick_insert_bar()
-        main_layout.addWidget(quick_insert_area)
+        # Quick Insert Bar (three lines of 0-59), built in showEvent;
+        # a same-height placeholder holds its place in the layout until then.
+        # The area shows the whole grid plus its always-on horizontal scrollbar;
+        # APP_QSS removes its frame (border: none), so nothing else adds height
+        self.quick_insert_height = QuickInsertGrid.HEIGHT + self.style().pixelMetric(QStyle.PM_ScrollBarExtent)
+        self.quick_insert_placeholder = QWidget()
+        self.quick_insert_placeholder.setFixedHeight(self.quick_insert_height)
+        main_layout.addWidget(self.quick_insert_placeholder)
 
         # Video List
-        self.video_list_widget = QListWidget()
-        self.video_list_widget.setStyleSheet(
-            "background-color: #1e1e1e; color: white; border: 1px solid #333;"
+        self.video_model = VideoModel(self)
+        self.video_delegate = VideoItemDelegate(self)
+        self.video_delegate.extractClicked.connect(
+            lambda row: self.extract_video(self.video_model.videos[row])
+        )
+        self.video_delegate.playClicked.connect(
+            lambda row: self.play_video(self.video_model.videos[row].path)
+        )
+        self.video_delegate.editClicked.connect(
+            lambda row: self.video_view.edit(self.video_model.index(row))
         )
-        main_layout.addWidget(self.video_list_widget)
+
+        self.video_view = QListView()
+        self.video_view.setObjectName("videoList")
+        self.video_view.setModel(self.video_model)
+        self.video_view.setItemDelegate(self.video_delegate)
+        self.video_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.video_view.setSelectionMode(QAbstractItemView.NoSelection)
+        # All rows share the delegate's row_size; skip per-row measuring
+        self.video_view.setUniformItemSizes(True)
+        # Rows are tall; scroll smoothly instead of a whole row per step
+        self.video_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        main_layout.addWidget(self.video_view)
 
         # Bottom Buttons Layout
         btn_layout = QHBoxLayout()
         self.select_btn = QPushButton("Add Videos")
-        self.select_btn.setStyleSheet(
-            "background-color: #1f1f1f; color: white; padding: 10px; border-radius: 5px; font-size: 16px;"
-        )
+        self.select_btn.setObjectName("addBtn")
         self.select_btn.clicked.connect(self.add_videos)
         btn_layout.addWidget(self.select_btn)
 
         self.extract_all_btn = QPushButton("Extract All Videos")
-        self.extract_all_btn.setStyleSheet(
-            "background-color: #4caf50; color: white; font-weight: bold; padding: 10px; border-radius: 5px; font-size: 16px;"
-        )
+        self.extract_all_btn.setObjectName("extractAllBtn")
         self.extract_all_btn.clicked.connect(self.extract_all_videos)
         btn_layout.addWidget(self.extract_all_btn)
 
         main_layout.addLayout(btn_layout)
 
-        # 1:3 ratio for quick-insert area vs. video list
-        main_layout.setStretchFactor(quick_insert_area, 1)
-        main_layout.setStretchFactor(self.video_list_widget, 3)
+        # The quick-insert area has a fixed height; the video list takes the rest
+        main_layout.setStretchFactor(self.video_view, 1)
 
         self.setLayout(main_layout)
 
+    def showEvent(self, e):
+        if self.quick_insert_placeholder is not None:
+            self.layout().replaceWidget(self.quick_insert_placeholder, self.create_quick_insert_bar())
+            self.quick_insert_placeholder.deleteLater()
+            self.quick_insert_placeholder = None
+        super().showEvent(e)
+
     def create_quick_insert_bar(self):
         """
-        Creates a scrollable area with 60 buttons (0-59),
-        laid out in 3 rows (each row = 20 buttons).
-        0,1,2 => cyan text (#00FFFF); others => magenta (#FF00FF).
+        Creates a horizontally scrollable area holding the painted 0-59 quick-insert grid,
+        laid out in 3 rows (each row = 20 cells).
+        The grid size is fixed, so the area is sized to show all 3 rows and the
+        scrollbar policies are fixed too (no visibility decision on each resize).
         """
         scroll_area = QScrollArea()
-        scroll_area.setStyleSheet("border: none;")
+        scroll_area.setObjectName("quickInsertArea")
         scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        container = QWidget()
-        grid_layout = QGridLayout(container)
-        grid_layout.setSpacing(6)
-        grid_layout.setContentsMargins(0, 0, 0, 0)
-
-        for i in range(60):
-            btn = QPushButton(str(i))
-            btn.setFixedSize(80, 80)
-            if i in [0, 1, 2]:
-                text_color = "#00FFFF"  # cyan
-            else:
-                text_color = "#FF00FF"  # magenta
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    color: {text_color};
-                    background-color: #2a2a2a;
-                    border-radius: 0;
-                    font-size: 24px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: #444444;
-                }}
-            """)
-            btn.clicked.connect(partial(self.handle_quick_insert, i))
-            row = i // 20
-            col = i % 20
-            grid_layout.addWidget(btn, row, col)
-
-        scroll_area.setWidget(container)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        grid = QuickInsertGrid()
+        grid.valueClicked.connect(self.handle_quick_insert)
+        scroll_area.setFixedHeight(self.quick_insert_height)
+
+        scroll_area.setWidget(grid)
         return scroll_area
 
     def handle_quick_insert(self, value):
@@ -170,82 +694,44 @@ class VideoExtractor(QWidget):
         file_dialog = QFileDialog()
         files, _ = file_dialog.getOpenFileNames(self, "Select Videos", "", "Video Files (*.mp4 *.avi *.mkv)")
         for file in files:
-            if file not in self.video_list:
-                self.video_list.append(file)
-                self.add_video_ui(file)
-
-    def add_video_ui(self, file_path):
-        """Adds a UI block for a video with IN-OUT selectors, Extract and Play buttons."""
-        video_frame = QFrame()
-        video_frame.setStyleSheet("background-color: #1e1e1e; border: none; margin: 10px;")
-        video_layout = QVBoxLayout()
-        video_layout.setSpacing(10)
-
-        # Video Title
-        video_label = QLabel(f"📽 {os.path.basename(file_path)}")
-        video_label.setFont(QFont("Arial", 14, QFont.Bold))
-        video_layout.addWidget(video_label)
-
-        # Time Selectors Layout
-        time_layout = QHBoxLayout()
-        time_layout.setSpacing(5)
-
-        in_hour, in_min, in_sec = self.create_time_wheels()
-        out_hour, out_min, out_sec = self.create_time_wheels()
-
-        for widget in [in_hour, in_min, in_sec, out_hour, out_min, out_sec]:
-            widget.setFixedSize(180, 60)
-
-        in_label = QLabel("IN:")
-        in_label.setFont(QFont("Arial", 18, QFont.Bold))
-        in_label.setStyleSheet("color: #E0E0E0; margin-right: 5px;")
-        time_layout.addWidget(in_label)
-        time_layout.addWidget(in_hour)
-        time_layout.addWidget(QLabel(":"))
-        time_layout.addWidget(in_min)
-        time_layout.addWidget(QLabel(":"))
-        time_layout.addWidget(in_sec)
-
-        time_layout.addSpacing(20)
-
-        out_label = QLabel("OUT:")
-        out_label.setFont(QFont("Arial", 18, QFont.Bold))
-        out_label.setStyleSheet("color: #E0E0E0; margin-right: 5px;")
-        time_layout.addWidget(out_label)
-        time_layout.addWidget(out_hour)
-        time_layout.addWidget(QLabel(":"))
-        time_layout.addWidget(out_min)
-        time_layout.addWidget(QLabel(":"))
-        time_layout.addWidget(out_sec)
-
-        video_layout.addLayout(time_layout)
-
-        # Extract Button
-        extract_btn = QPushButton("Extract")
-        extract_btn.setStyleSheet(
-            "background-color: #00FFFF; color: #000000; font-weight: bold; "
-            "padding: 10px; border-radius: 5px; font-size: 16px;"
-        )
-        extract_btn.clicked.connect(
-            lambda: self.extract_video(file_path, in_hour, in_min, in_sec, out_hour, out_min, out_sec)
-        )
-        video_layout.addWidget(extract_btn)
-        
-        # Play Button
-        play_btn = QPushButton("Play")
-        play_btn.setStyleSheet(
-            "background-color: #32CD32; color: #000000; font-weight: bold; "
-            "padding: 10px; border-radius: 5px; font-size: 16px;"
-        )
-        play_btn.clicked.connect(lambda: self.play_video(file_path))
-        video_layout.addWidget(play_btn)
-
-        video_frame.setLayout(video_layout)
-
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(video_frame.sizeHint())
-        self.video_list_widget.addItem(list_item)
-        self.video_list_widget.setItemWidget(list_item, video_frame)
+            if file not in self.video_paths_set:
+                self.video_paths_set.add(file)
+                self.video_model.append_video(VideoRow(file))
+                self.probe_duration(self.video_model.rowCount() - 1)
+
+    def probe_duration(self, row):
+        """Pre-fills a row's OUT time with the file duration, read by ffprobe in the background."""
+        video = self.video_model.videos[row]
+        proc = QProcess(self)
+        proc.setProgram("ffprobe")
+        proc.setArguments(["-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", video.path])
+        proc.setStandardInputFile(QProcess.nullDevice())
+
+        def finish(code, status):
+            output = bytes(proc.readAllStandardOutput()).decode(errors="replace").strip()
+            proc.deleteLater()
+            if status != QProcess.NormalExit or code != 0:
+                return
+            try:
+                duration = int(float(output))
+            except ValueError:
+                return  # "N/A" or no output: leave OUT to the user
+            if (video.out_hour, video.out_min, video.out_sec) != (0, 0, 0):
+                return  # Already set by the user
+            hours, rest = divmod(min(duration, 24 * 3600 - 1), 3600)
+            minutes, seconds = divmod(rest, 60)
+            self.video_model.setData(
+                self.video_model.index(row), {"out_hour": hours, "out_min": minutes, "out_sec": seconds}
+            )
+
+        def handle_error(error):
+            # Without ffprobe the OUT time simply stays at 00:00:00
+            if error == QProcess.FailedToStart:
+                proc.deleteLater()
+
+        proc.finished.connect(finish)
+        proc.errorOccurred.connect(handle_error)
+        proc.start()
 
     def create_time_wheels(self):
         """Creates three time selector wheels (HH:MM:SS) with manual editing and focus tracking."""
@@ -253,88 +739,108 @@ class VideoExtractor(QWidget):
         minute = FocusComboBox(self, main_window=self, min_val=0, max_val=59, base_color="#39FF14")
         second = FocusComboBox(self, main_window=self, min_val=0, max_val=59, base_color="red")
 
-        hour.addItems([f"{i:02d}" for i in range(24)])
-        minute.addItems([f"{i:02d}" for i in range(60)])
-        second.addItems([f"{i:02d}" for i in range(60)])
-
-        hour.setMaxVisibleItems(60)
-        minute.setMaxVisibleItems(60)
-        second.setMaxVisibleItems(60)
-
-        hour.setStyleSheet(hour.styleSheet() + """
-            QComboBox {
-                background-color: #222; color: #00FFFF;
-                font-size: 32px; font-weight: bold;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #222; color: #00FFFF;
-                selection-background-color: #333;
-                font-size: 32px; font-weight: bold;
-            }
-        """)
-        minute.setStyleSheet(minute.styleSheet() + """
-            QComboBox {
-                background-color: #222; color: #39FF14;
-                font-size: 32px; font-weight: bold;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #222; color: #39FF14;
-                selection-background-color: #333;
-                font-size: 32px; font-weight: bold;
-            }
-        """)
-        second.setStyleSheet(second.styleSheet() + """
-            QComboBox {
-                background-color: #222; color: red;
-                font-size: 32px; font-weight: bold;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #222; color: red;
-                selection-background-color: #333;
-                font-size: 32px; font-weight: bold;
-            }
-        """)
+        hour.setModel(HOUR_MODEL)
+        minute.setModel(MIN_SEC_MODEL)
+        second.setModel(MIN_SEC_MODEL)
+
+        hour.setMaxVisibleItems(10)
+        minute.setMaxVisibleItems(10)
+        second.setMaxVisibleItems(10)
 
         return hour, minute, second
 
-    def extract_video(self, file_path, in_hour, in_min, in_sec, out_hour, out_min, out_sec):
-        in_time = self.get_selected_time(in_hour, in_min, in_sec)
-        out_time = self.get_selected_time(out_hour, out_min, out_sec)
-        if in_time >= out_time:
-            QMessageBox.warning(self, "Invalid Time", "OUT time must be greater than IN time.")
+    def extract_video(self, video):
+        times = self.get_extraction_times(video)
+        if times is None:
             return
-        self.process_extraction(file_path, in_time, out_time)
-        QMessageBox.information(self, "Done", f"Extraction completed for {os.path.basename(file_path)}!")
+        self.queue_extraction(video.path, *times, lambda status: self.report_extractions([(video.path, status)]))
 
     def extract_all_videos(self):
-        for index in range(self.video_list_widget.count()):
-            item = self.video_list_widget.item(index)
-            video_frame = self.video_list_widget.itemWidget(item)
-            video_label = video_frame.layout().itemAt(0).widget().text().replace("📽 ", "")
-            video_path = next((path for path in self.video_list if os.path.basename(path) == video_label), None)
-            if not video_path:
-                continue
-            time_layout = video_frame.layout().itemAt(1).layout()
-            in_hour, in_min, in_sec = time_layout.itemAt(1).widget(), time_layout.itemAt(3).widget(), time_layout.itemAt(5).widget()
-            out_hour, out_min, out_sec = time_layout.itemAt(8).widget(), time_layout.itemAt(10).widget(), time_layout.itemAt(12).widget()
-            self.extract_video(video_path, in_hour, in_min, in_sec, out_hour, out_min, out_sec)
-
-    def get_selected_time(self, hour_combo, minute_combo, second_combo):
-        def safe_int(val):
-            try:
-                return int(val)
-            except:
-                return 0
-        h = safe_int(hour_combo.currentText())
-        m = safe_int(minute_combo.currentText())
-        s = safe_int(second_combo.currentText())
-        return h * 3600 + m * 60 + s
-
-    def process_extraction(self, input_file, start_time, end_time):
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.basename(input_file)
-        output_file = os.path.join(OUTPUT_FOLDER, f"{filename}_clip_{timestamp}.mp4")
-        subprocess.run(["ffmpeg", "-i", input_file, "-ss", str(start_time), "-to", str(end_time), "-c", "copy", output_file])
+        """Queues every valid row; one message is shown once all of them have finished."""
+        jobs = []
+        for row in range(self.video_model.rowCount()):
+            video = self.video_model.index(row).data(Qt.UserRole)
+            times = self.get_extraction_times(video)
+            if times is not None:
+                jobs.append((video.path, *times))
+
+        results = []
+        def on_done(input_file, status):
+            results.append((input_file, status))
+            if len(results) == len(jobs):
+                self.report_extractions(results)
+
+        for input_file, start_time, end_time in jobs:
+            self.queue_extraction(input_file, start_time, end_time, partial(on_done, input_file))
+
+    def report_extractions(self, results):
+        """Shows the outcome of a list of (input_file, status) extractions."""
+        def names(wanted):
+            return [os.path.basename(path) for path, status in results if status == wanted]
+        done, cached, failed = names("done"), names("cached"), names("failed")
+        if done:
+            QMessageBox.information(self, "Done", f"Extraction completed for {', '.join(done)}!")
+        if cached:
+            QMessageBox.information(
+                self, "Already Extracted",
+                f"Same IN/OUT already extracted for {', '.join(cached)}; kept the existing clip."
+            )
+        if failed:
+            QMessageBox.warning(self, "Extraction Failed", f"ffmpeg failed for {', '.join(failed)}.")
+
+    def get_extraction_times(self, video):
+        """Returns (in_time, out_time) as HH:MM:SS, or None after warning about an invalid range."""
+        in_time = self.get_selected_hms(video.in_hour, video.in_min, video.in_sec)
+        out_time = self.get_selected_hms(video.out_hour, video.out_min, video.out_sec)
+        # Zero-padded HH:MM:SS strings compare in time order
+        if in_time >= out_time:
+            QMessageBox.warning(
+                self, "Invalid Time",
+                f"OUT time must be greater than IN time ({os.path.basename(video.path)})."
+            )
+            return None
+        return in_time, out_time
+
+    def get_selected_hms(self, hours, minutes, seconds):
+        """Formats a time as HH:MM:SS, which ffmpeg takes directly for -ss/-to."""
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def queue_extraction(self, input_file, start_time, end_time, on_done):
+        """
+        Hands one clip to the ExtractWorker. on_done(status) is called with "done"
+        or "failed" when its ffmpeg exits, or right away with "cached" if the same
+        clip was already extracted and its output file still exists.
+        A clip that is still being extracted is not started again: on_done waits
+        for the running job instead.
+        """
+        key = (input_file, start_time, end_time)
+        cached = self.extract_cache.get(key)
+        if cached is not None and os.path.exists(cached):
+            on_done("cached")
+            return
+        if key in self.pending_callbacks:
+            self.pending_callbacks[key].append(on_done)
+            return
+        job_id = self.next_job_id
+        self.next_job_id += 1
+        self.pending_jobs[job_id] = key
+        self.pending_callbacks[key] = [on_done]
+        self.extractionRequested.emit(job_id, *key)
+
+    def handle_job_done(self, job_id, status, output_file):
+        key = self.pending_jobs.pop(job_id)
+        if status == "done":
+            self.extract_cache[key] = output_file
+        for on_done in self.pending_callbacks.pop(key):
+            on_done(status)
+
+    def closeEvent(self, e):
+        # Once stopped, the thread has deleted the worker; a second close has nothing to stop
+        if self.extract_thread.isRunning():
+            QMetaObject.invokeMethod(self.extract_worker, "stop", Qt.BlockingQueuedConnection)
+            self.extract_thread.quit()
+            self.extract_thread.wait()
+        super().closeEvent(e)
 
     def play_video(self, file_path):
         """Plays the selected video using the default video player."""
@@ -343,6 +849,7 @@ class VideoExtractor(QWidget):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     window = VideoExtractor()
     window.show()
     sys.exit(app.exec_())